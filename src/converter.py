@@ -7,33 +7,251 @@ OFT files use the same MSG format as regular Outlook messages but with a differe
 
 Usage:
     python oft_to_eml_converter.py <input_oft_file> [output_eml_file]
+    python oft_to_eml_converter.py [--jobs N] <input_oft_file_or_dir> ...
 """
 
 import sys
 import os
+import re
+import argparse
+import importlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.mime.base import MIMEBase
-from email import encoders
-import extract_msg
+from email.message import EmailMessage, MIMEPart
+from email.generator import BytesGenerator
+from email.parser import HeaderParser
+from email import policy
+from email.utils import format_datetime
 
+try:
+    # Optional SIMD-accelerated base64 (libbase64); much faster on large attachments
+    from pybase64 import b64encode
+except ImportError:
+    # binascii directly, without the base64 module's wrapper; line wrapping is done separately
+    from binascii import b2a_base64
+    from functools import partial
+    b64encode = partial(b2a_base64, newline=False)
 
-def convert_oft_to_eml(oft_file_path, eml_file_path=None):
+# Progress and message info output; disable with OFT2EML_VERBOSE=0 or -q, force with -v
+_VERBOSE = os.environ.get('OFT2EML_VERBOSE', '1') != '0'
+
+# Set in batch worker processes, where the parent reports failures
+_IN_WORKER = False
+
+# Output buffer size; keeps write() calls few when flushing large base64 payloads
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Raw bytes encoded per base64 call; a multiple of 57 so every chunk ends on a full 76-char line
+_BASE64_CHUNK_SIZE = 57 * 1024
+
+# Modern email policy; also used to serialize the output file. Headers are only
+# folded past RFC 5322's 998-character limit so long Content-IDs stay intact
+# (cid: references in the HTML must match them exactly).
+_POLICY = policy.default.clone(max_line_length=998)
+
+# Banner Outlook may put before the stored transport headers
+_HEADERS_BANNER = 'Microsoft Mail Internet Headers Version 2.0'
+
+# Line breaks (with surrounding whitespace) inside header values from the OFT
+_HEADER_LINE_BREAKS = re.compile(r'\s*[\r\n]+\s*')
+
+# Matches a line over RFC 5322's 998-character limit for 7bit/8bit bodies
+_OVERLONG_LINE = re.compile(rb'^[^\r\n]{999}', re.MULTILINE)
+
+# Inline image file extensions and their MIME image subtypes
+_IMAGE_SUBTYPE = {
+    'png': 'png',
+    'jpg': 'jpeg',
+    'jpeg': 'jpeg',
+    'gif': 'gif',
+    'bmp': 'bmp',
+}
+
+
+def _header_value(value):
+    """
+    Collapse line breaks in a header value, which the email policy rejects.
+    
+    Args:
+        value (str): The header value read from the OFT
+        
+    Returns:
+        str: The value on a single line
+    """
+    return _HEADER_LINE_BREAKS.sub(' ', value).strip()
+
+
+def _image_subtype(filename):
+    """
+    Get the MIME image subtype for an inline image filename.
+    
+    Args:
+        filename (str): The attachment filename
+        
+    Returns:
+        str: The image subtype, or None if the file is not a supported image
+    """
+    # Slice off only the extension; rpartition would also copy the rest of the name
+    dot = filename.rfind('.')
+    return _IMAGE_SUBTYPE.get(filename[dot + 1:].lower()) if dot >= 0 else None
+
+
+def _set_text_content(part, text, subtype):
+    """
+    Set a UTF-8 text body on a MIME part without re-encoding the content.
+    
+    The body is stored unencoded (7bit/8bit) unless it contains lines that
+    are too long for that, in which case base64 is used. Existing Content-*
+    headers of the part are replaced.
+    
+    Args:
+        part (MIMEPart): The MIME part to fill
+        text (str or bytes): The body text
+        subtype (str): MIME text subtype, e.g. 'plain' or 'html'
+    """
+    data = text.encode('utf-8') if isinstance(text, str) else text
+    if _OVERLONG_LINE.search(data):
+        part.clear_content()
+        part['Content-Type'] = f'text/{subtype}; charset="utf-8"'
+        _set_base64_payload(part, data)
+    else:
+        # 8bit is fine for .eml files opened by mail clients; relaying such a
+        # file over SMTP requires a server that supports 8BITMIME.
+        cte = '7bit' if data.isascii() else '8bit'
+        part.set_content(data, 'text', subtype, cte=cte, params={'charset': 'utf-8'})
+
+
+def _text_part(text, subtype):
+    """
+    Build a UTF-8 text body part without re-encoding the content.
+    
+    Args:
+        text (str or bytes): The body text
+        subtype (str): MIME text subtype, e.g. 'plain' or 'html'
+        
+    Returns:
+        MIMEPart: The body part
+    """
+    part = MIMEPart(policy=_POLICY)
+    _set_text_content(part, text, subtype)
+    return part
+
+
+def _passthrough_message(header_text, body, html_body):
+    """
+    Build a message from the stored transport headers and the matching body.
+    
+    Only well-formed single-part text messages with From and Subject headers
+    qualify: the original headers are kept as they are, and their Content-*
+    headers are replaced to describe the UTF-8 body taken from the OFT.
+    
+    Args:
+        header_text (str): Raw transport message headers (optional)
+        body (str): The plain text body (optional)
+        html_body (str or bytes): The HTML body (optional)
+        
+    Returns:
+        EmailMessage: The message, or None if it needs a full MIME rebuild
+    """
+    if not header_text:
+        return None
+    # Strip the banner the same way extract_msg does
+    if header_text.startswith(_HEADERS_BANNER):
+        header_text = header_text[len(_HEADERS_BANNER):].lstrip()
+    
+    mime_msg = HeaderParser(policy=_POLICY).parsestr(header_text)
+    if mime_msg.defects or 'From' not in mime_msg or 'Subject' not in mime_msg:
+        return None
+    content_type = mime_msg.get_content_type()
+    if content_type == 'text/plain' and body:
+        _set_text_content(mime_msg, body, 'plain')
+    elif content_type == 'text/html' and html_body:
+        _set_text_content(mime_msg, html_body, 'html')
+    else:
+        return None
+    return mime_msg
+
+
+def _write_eml(mime_msg, eml_file_path):
+    """
+    Serialize a message to an EML file.
+    
+    Args:
+        mime_msg (EmailMessage): The message to write
+        eml_file_path (str): Path to the output EML file
+    """
+    with open(eml_file_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+        # Write bytes directly, without the extra as_string() str and its UTF-8 encoded copy
+        BytesGenerator(f, policy=_POLICY).flatten(mime_msg)
+
+
+def _build_body_container(body, html_body):
+    """
+    Build the body part(s) of the message.
+    
+    A multipart/alternative container is only used when both a plain text
+    and an HTML body exist; a single body part is returned on its own.
+    
+    Args:
+        body (str): The plain text body (optional)
+        html_body (str or bytes): The HTML body (optional)
+        
+    Returns:
+        MIMEPart: The body part or alternative container, or None if there is no body
+    """
+    body_parts = []
+    if body:
+        body_parts.append(_text_part(body, 'plain'))
+    if html_body:
+        body_parts.append(_text_part(html_body, 'html'))
+    
+    if len(body_parts) < 2:
+        return body_parts[0] if body_parts else None
+    
+    msg_alternative = MIMEPart(policy=_POLICY)
+    msg_alternative.make_alternative()
+    msg_alternative.set_payload(body_parts)
+    return msg_alternative
+
+
+def _set_base64_payload(part, data):
+    """
+    Set raw bytes as the base64-encoded payload of a MIME part.
+    
+    The encoded output is wrapped at 76 characters per line (RFC 2045).
+    Data is encoded chunk by chunk from a memoryview. This avoids separate
+    full-size encoded and wrapped bytes copies, though the encoded chunks
+    and the joined payload string briefly coexist.
+    
+    Args:
+        part (MIMEPart): The MIME part to fill
+        data (bytes): The raw attachment data
+    """
+    view = memoryview(data)
+    chunks = []
+    for start in range(0, len(view), _BASE64_CHUNK_SIZE):
+        encoded = b64encode(view[start:start + _BASE64_CHUNK_SIZE])
+        chunks.append(b'\r\n'.join([encoded[i:i + 76] for i in range(0, len(encoded), 76)]).decode('ascii'))
+    part.set_payload('\r\n'.join(chunks))
+    part['Content-Transfer-Encoding'] = 'base64'
+
+
+def convert_oft_to_eml(oft_file_path, eml_file_path=None, passthrough=False):
     """
     Convert an OFT file to EML format.
     
     Args:
         oft_file_path (str): Path to the input OFT file
         eml_file_path (str): Path to the output EML file (optional)
+        passthrough (bool): Reuse the stored transport headers of single-part
+            messages without attachments instead of rebuilding the headers
         
     Returns:
         str: Path to the created EML file
     """
-    
-    # Validate input file
-    if not os.path.exists(oft_file_path):
-        raise FileNotFoundError(f"Input file not found: {oft_file_path}")
+    # Imported here: extract_msg pulls in many modules, which --help and argument errors don't need
+    import extract_msg
     
     # Generate output filename if not provided
     if eml_file_path is None:
@@ -42,111 +260,274 @@ def convert_oft_to_eml(oft_file_path, eml_file_path=None):
     
     try:
         # Extract message from OFT file using extract_msg
-        print(f"Reading OFT file: {oft_file_path}")
-        msg = extract_msg.Message(oft_file_path)
-        
-        # Create MIME message - use 'related' to support inline images
-        mime_msg = MIMEMultipart('related')
-        
-        # Set headers
-        if msg.sender:
-            mime_msg['From'] = msg.sender
-        if msg.to:
-            mime_msg['To'] = msg.to
-        if msg.cc:
-            mime_msg['Cc'] = msg.cc
-        if msg.subject:
-            mime_msg['Subject'] = msg.subject
-        if msg.date:
-            mime_msg['Date'] = msg.date.strftime('%a, %d %b %Y %H:%M:%S %z') if hasattr(msg.date, 'strftime') else str(msg.date)
-        
-        # Create alternative container for text/html content
-        msg_alternative = MIMEMultipart('alternative')
-        
-        # Add message body
-        if msg.body:
-            text_part = MIMEText(msg.body, 'plain', 'utf-8')
-            msg_alternative.attach(text_part)
-        
-        if msg.htmlBody:
-            html_part = MIMEText(msg.htmlBody, 'html', 'utf-8')
-            msg_alternative.attach(html_part)
-        
-        # Add the alternative part to the main message
-        mime_msg.attach(msg_alternative)
-        
-        # Add attachments if any
-        if msg.attachments:
-            print(f"Found {len(msg.attachments)} attachments")
-            for attachment in msg.attachments:
-                if hasattr(attachment, 'data') and attachment.data:
-                    filename = attachment.longFilename or attachment.shortFilename or "attachment"
-                    
-                    # Check if this is an embedded image (has Content-ID)
-                    content_id = getattr(attachment, 'contentId', None)
-                    
-                    if content_id and filename.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp')):
-                        # Handle as inline image
-                        image_type = filename.split('.')[-1].lower()
-                        if image_type == 'jpg':
-                            image_type = 'jpeg'
+        if _VERBOSE:
+            print(f"Reading OFT file: {oft_file_path}")
+        # Let the open itself detect a missing file (no separate exists() check)
+        try:
+            msg = extract_msg.Message(oft_file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Input file not found: {oft_file_path}") from None
+        
+        # Read message properties once; extract_msg may decode them on every access
+        sender = msg.sender
+        to = msg.to
+        cc = msg.cc
+        subject = msg.subject
+        date = msg.date
+        body = msg.body
+        html_body = msg.htmlBody
+        attachments = msg.attachments
+        
+        # Fast path: copy the stored transport headers instead of rebuilding the MIME tree
+        mime_msg = None
+        if passthrough and not attachments:
+            mime_msg = _passthrough_message(msg.headerText, body, html_body)
+            if mime_msg is not None and _VERBOSE:
+                print("Using stored transport headers")
+        
+        if mime_msg is None:
+            # Create MIME message - use 'related' to support inline images
+            mime_msg = EmailMessage(policy=_POLICY)
+            
+            # Set headers
+            mime_msg['MIME-Version'] = '1.0'
+            if sender:
+                mime_msg['From'] = _header_value(sender)
+            if to:
+                mime_msg['To'] = _header_value(to)
+            if cc:
+                mime_msg['Cc'] = _header_value(cc)
+            if subject:
+                mime_msg['Subject'] = _header_value(subject)
+            if isinstance(date, datetime):
+                mime_msg['Date'] = format_datetime(date)
+            
+            # Collect the parts of the main message and set them in one go
+            body_container = _build_body_container(body, html_body)
+            parts = [body_container] if body_container else []
+            
+            # Add attachments if any
+            if attachments:
+                if _VERBOSE:
+                    print(f"Found {len(attachments)} attachments")
+                for attachment in attachments:
+                    # Read each attachment property once; extract_msg may re-parse streams on access
+                    data = getattr(attachment, 'data', None)
+                    if data:
+                        filename = attachment.longFilename or attachment.shortFilename or "attachment"
+                        
+                        # Check if this is an embedded image (has Content-ID)
+                        content_id = getattr(attachment, 'contentId', None)
+                        image_type = _image_subtype(filename)
                         
-                        part = MIMEBase('image', image_type)
-                        part.set_payload(attachment.data)
-                        encoders.encode_base64(part)
+                        if content_id and image_type:
+                            # Handle as inline image
+                            part = MIMEPart(policy=_POLICY)
+                            part['Content-Type'] = f'image/{image_type}'
+                            _set_base64_payload(part, data)
+                            
+                            # Set Content-ID for inline images
+                            part['Content-ID'] = f'<{content_id}>'
+                            part.add_header('Content-Disposition', 'inline', filename=filename)
+                            if _VERBOSE:
+                                print(f"  Added inline image: {filename} (Content-ID: {content_id})")
+                        else:
+                            # Handle as regular attachment
+                            part = MIMEPart(policy=_POLICY)
+                            part['Content-Type'] = 'application/octet-stream'
+                            _set_base64_payload(part, data)
+                            part.add_header('Content-Disposition', 'attachment', filename=filename)
+                            if _VERBOSE:
+                                print(f"  Added attachment: {filename}")
                         
-                        # Set Content-ID for inline images
-                        part.add_header('Content-ID', f'<{content_id}>')
-                        part.add_header('Content-Disposition', 'inline', filename=filename)
-                        print(f"  Added inline image: {filename} (Content-ID: {content_id})")
-                    else:
-                        # Handle as regular attachment
-                        part = MIMEBase('application', 'octet-stream')
-                        part.set_payload(attachment.data)
-                        encoders.encode_base64(part)
-                        part.add_header('Content-Disposition', f'attachment; filename="{filename}"')
-                        print(f"  Added attachment: {filename}")
-                    
-                    mime_msg.attach(part)
+                        parts.append(part)
+            
+            mime_msg.make_related()
+            mime_msg.set_payload(parts)
         
         # Write EML file
-        print(f"Writing EML file: {eml_file_path}")
-        with open(eml_file_path, 'w', encoding='utf-8') as f:
-            f.write(mime_msg.as_string())
-        
-        print(f"Conversion completed successfully!")
-        print(f"Output: {eml_file_path}")
-        
-        # Print some info about the converted message
-        print("\n--- Message Info ---")
-        print(f"From: {msg.sender or 'N/A'}")
-        print(f"To: {msg.to or 'N/A'}")
-        print(f"Subject: {msg.subject or 'N/A'}")
-        print(f"Date: {msg.date or 'N/A'}")
-        print(f"Body length: {len(msg.body) if msg.body else 0} chars")
-        print(f"HTML body length: {len(msg.htmlBody) if msg.htmlBody else 0} chars")
-        print(f"Attachments: {len(msg.attachments) if msg.attachments else 0}")
+        if _VERBOSE:
+            print(f"Writing EML file: {eml_file_path}")
+        _write_eml(mime_msg, eml_file_path)
+        
+        if _VERBOSE:
+            # Print some info about the converted message in a single write
+            sys.stdout.write("\n".join([
+                "Conversion completed successfully!",
+                f"Output: {eml_file_path}",
+                "",
+                "--- Message Info ---",
+                f"From: {sender or 'N/A'}",
+                f"To: {to or 'N/A'}",
+                f"Subject: {subject or 'N/A'}",
+                f"Date: {date or 'N/A'}",
+                f"Body length: {len(body) if body else 0} chars",
+                f"HTML body length: {len(html_body) if html_body else 0} chars",
+                f"Attachments: {len(attachments) if attachments else 0}",
+            ]) + "\n")
         
         return eml_file_path
         
     except Exception as e:
-        print(f"Error during conversion: {str(e)}")
+        if _VERBOSE and not _IN_WORKER:
+            print(f"Error during conversion: {str(e)}")
         raise
 
 
+def collect_oft_files(paths):
+    """
+    Expand the given paths into a list of OFT files.
+    
+    Args:
+        paths (list): File paths and/or directories containing .oft files
+        
+    Returns:
+        list: Paths of the OFT files to convert
+    """
+    oft_files = []
+    for path in paths:
+        if os.path.isdir(path):
+            oft_files.extend(sorted(
+                str(entry) for entry in Path(path).iterdir()
+                if entry.is_file() and entry.suffix.lower() == '.oft'
+            ))
+        else:
+            oft_files.append(path)
+    return oft_files
+
+
+def _batch_output_paths(oft_files):
+    """
+    Work out a distinct output path for each file in a batch.
+    
+    Outputs go to the current directory as <stem>.eml, like single-file
+    conversions. Inputs sharing a stem (compared case-insensitively, as on
+    the default macOS file system) get a numeric suffix, e.g. x-1.eml.
+    
+    Args:
+        oft_files (list): Paths of the OFT files to convert
+        
+    Returns:
+        list: Output EML path for each input, in the same order
+    """
+    used = set()
+    eml_files = []
+    for oft_file in oft_files:
+        stem = Path(oft_file).stem
+        eml_file = f"{stem}.eml"
+        counter = 1
+        while eml_file.lower() in used:
+            eml_file = f"{stem}-{counter}.eml"
+            counter += 1
+        used.add(eml_file.lower())
+        eml_files.append(eml_file)
+    return eml_files
+
+
+def _init_worker(verbose):
+    """Apply the parent's verbosity setting and pre-load extract_msg in a batch worker process."""
+    global _VERBOSE, _IN_WORKER
+    _VERBOSE = verbose
+    _IN_WORKER = True
+    importlib.import_module('extract_msg')
+
+
+def convert_batch(oft_files, jobs=None, passthrough=False):
+    """
+    Convert several OFT files in parallel worker processes.
+    
+    Args:
+        oft_files (list): Paths of the OFT files to convert
+        jobs (int): Number of worker processes (optional, defaults to CPU count)
+        passthrough (bool): Reuse stored transport headers where possible
+        
+    Returns:
+        int: Number of files that failed to convert
+    """
+    failures = 0
+    workers = min(jobs or os.cpu_count() or 1, len(oft_files))
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(_VERBOSE,)) as executor:
+        # Output paths are fixed here so workers never write to the same file
+        futures = {
+            executor.submit(convert_oft_to_eml, oft_file, eml_file, passthrough): oft_file
+            for oft_file, eml_file in zip(oft_files, _batch_output_paths(oft_files))
+        }
+        for future in as_completed(futures):
+            try:
+                result_file = future.result()
+                print(f"Success! EML file created: {result_file}")
+            except Exception as e:
+                failures += 1
+                print(f"Error: {futures[future]}: {str(e)}")
+    
+    return failures
+
+
+def _positive_int(value):
+    """Argparse type for options that need a whole number of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+
 def main():
     """Main entry point for the script."""
+    global _VERBOSE
+    
+    parser = argparse.ArgumentParser(
+        description="Convert Outlook Template (.oft) files to EML format.",
+        epilog="Example: python oft_to_eml_converter.py template.oft output.eml",
+    )
+    parser.add_argument('paths', nargs='+', metavar='path',
+                        help="input OFT file and optional output EML file, "
+                             "or several OFT files/directories to convert in batch; "
+                             "two paths mean input and output unless the second ends in .oft "
+                             "or is a directory")
+    parser.add_argument('-j', '--jobs', type=_positive_int, default=None,
+                        help="number of worker processes for batch conversion (default: CPU count)")
+    parser.add_argument('--fast-passthrough', action='store_true',
+                        help="for single-part messages without attachments, copy the stored "
+                             "transport headers instead of rebuilding them (output may differ)")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument('-q', '--quiet', action='store_true',
+                           help="only report results and errors, no progress or message info")
+    verbosity.add_argument('-v', '--verbose', action='store_true',
+                           help="print progress and message info even if OFT2EML_VERBOSE=0")
+    args = parser.parse_args()
+    
+    if args.quiet:
+        _VERBOSE = False
+    elif args.verbose:
+        _VERBOSE = True
+    
+    # Single-file form: <input_oft_file> [output_eml_file]
+    paths = args.paths
+    if len(paths) == 2 and not os.path.isdir(paths[1]) and not paths[1].lower().endswith('.oft'):
+        oft_files, eml_file = [paths[0]], paths[1]
+        # Guard against a second input file being taken as the output and overwritten
+        if os.path.isfile(eml_file) and not eml_file.lower().endswith('.eml'):
+            parser.error(f"refusing to overwrite existing file {eml_file!r}: "
+                         "the output file must end in .eml")
+    else:
+        oft_files, eml_file = collect_oft_files(paths), None
     
-    if len(sys.argv) < 2:
-        print("Usage: python oft_to_eml_converter.py <input_oft_file> [output_eml_file]")
-        print("Example: python oft_to_eml_converter.py template.oft output.eml")
+    if not oft_files:
+        print("Error: No OFT files found")
         sys.exit(1)
     
-    oft_file = sys.argv[1]
-    eml_file = sys.argv[2] if len(sys.argv) > 2 else None
+    if len(oft_files) > 1:
+        failures = convert_batch(oft_files, args.jobs, args.fast_passthrough)
+        print(f"\nConverted {len(oft_files) - failures} of {len(oft_files)} files")
+        sys.exit(1 if failures else 0)
     
     try:
-        result_file = convert_oft_to_eml(oft_file, eml_file)
+        result_file = convert_oft_to_eml(oft_files[0], eml_file, args.fast_passthrough)
         print(f"\nSuccess! EML file created: {result_file}")
     except Exception as e:
         print(f"Error: {str(e)}")
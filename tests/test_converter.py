@@ -12,6 +12,7 @@ import os
 import sys
 from pathlib import Path
 import email
+import email.policy
 from email.mime.multipart import MIMEMultipart
 
 # Add src to path to import our converter
@@ -164,6 +165,131 @@ class TestOFTConverter(unittest.TestCase):
         
         # Skip conversion test since minimal file will fail
         self.skipTest("Large file performance test skipped - minimal test file used")
+    
+    def test_collect_oft_files(self):
+        """Test that directories are expanded into the OFT files they contain."""
+        from converter import collect_oft_files
+        
+        for name in ("b.oft", "A.OFT", "notes.txt"):
+            (Path(self.temp_dir) / name).write_bytes(b"")
+        
+        oft_files = collect_oft_files([self.temp_dir, "single.oft"])
+        names = [Path(f).name for f in oft_files]
+        self.assertEqual(names, ["A.OFT", "b.oft", "single.oft"])
+    
+    def test_batch_same_stem_outputs(self):
+        """Test that batch inputs sharing a stem are written to distinct EML files."""
+        import converter
+        from concurrent.futures import ThreadPoolExecutor
+        from unittest import mock
+        
+        def fake_convert(oft_file_path, eml_file_path=None, passthrough=False):
+            Path(eml_file_path).write_text(oft_file_path)
+            return eml_file_path
+        
+        inputs = ["d1/x.oft", "d2/x.oft", "X.OFT"]
+        cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        try:
+            # Threads instead of processes so the patched conversion is used
+            with mock.patch.object(converter, 'ProcessPoolExecutor', ThreadPoolExecutor), \
+                 mock.patch.object(converter, 'convert_oft_to_eml', fake_convert):
+                failures = converter.convert_batch(inputs, jobs=2)
+        finally:
+            os.chdir(cwd)
+        
+        self.assertEqual(failures, 0)
+        outputs = sorted(p.name for p in Path(self.temp_dir).glob("*.eml"))
+        self.assertEqual(outputs, ["X-2.eml", "x-1.eml", "x.eml"])
+        contents = {(Path(self.temp_dir) / name).read_text() for name in outputs}
+        self.assertEqual(contents, set(inputs))
+    
+    def test_headers_and_content_ids_preserved(self):
+        """Test that long Content-IDs stay intact and multi-line headers don't fail."""
+        from datetime import datetime, timezone
+        from types import SimpleNamespace
+        from unittest import mock
+        
+        content_id = "image001.png@" + "0123456789abcdef" * 6
+        image = SimpleNamespace(data=b"\x89PNG" * 50, longFilename="image001.png",
+                                shortFilename=None, contentId=content_id)
+        fake_msg = SimpleNamespace(
+            sender="Sender <sender@example.com>", to="to@example.com", cc=None,
+            subject="line1\r\nline2", date=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+            body="text", htmlBody=f'<img src="cid:{content_id}">'.encode('utf-8'),
+            attachments=[image], headerText=None,
+        )
+        output_path = Path(self.temp_dir) / "headers.eml"
+        
+        with mock.patch.object(extract_msg, 'Message', return_value=fake_msg):
+            convert_oft_to_eml("template.oft", str(output_path))
+        
+        raw = output_path.read_bytes()
+        self.assertIn(f"Content-ID: <{content_id}>".encode('ascii'), raw)
+        msg = email.message_from_bytes(raw, policy=email.policy.default)
+        self.assertEqual(msg['Subject'], "line1 line2")
+        self.assertEqual(msg['Date'], "Tue, 02 Jan 2024 03:04:05 +0000")
+        
+        # A date that isn't a datetime is left out rather than written empty
+        fake_msg.date = "not a date"
+        with mock.patch.object(extract_msg, 'Message', return_value=fake_msg):
+            convert_oft_to_eml("template.oft", str(output_path))
+        self.assertNotIn(b"\nDate:", output_path.read_bytes())
+    
+    def test_main_argument_dispatch(self):
+        """Test that main() routes arguments to single-file or batch conversion."""
+        import io
+        import converter
+        from contextlib import redirect_stdout, redirect_stderr
+        from unittest import mock
+        
+        def run_main(*args):
+            with mock.patch.object(sys, 'argv', ['converter.py', *args]), \
+                 mock.patch.object(converter, '_VERBOSE', converter._VERBOSE), \
+                 mock.patch.object(converter, 'convert_oft_to_eml', return_value='out.eml') as single, \
+                 mock.patch.object(converter, 'convert_batch', return_value=0) as batch, \
+                 redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+                try:
+                    converter.main()
+                    code = 0
+                except SystemExit as e:
+                    code = e.code
+                verbose = converter._VERBOSE
+            return code, single, batch, verbose
+        
+        # <input> <output> converts a single file
+        code, single, batch, verbose = run_main("in.oft", "out.eml")
+        self.assertEqual(code, 0)
+        single.assert_called_once_with("in.oft", "out.eml", False)
+        batch.assert_not_called()
+        
+        # Several OFT files go to the batch path
+        code, single, batch, verbose = run_main("-j", "2", "a.oft", "b.oft", "c.oft")
+        self.assertEqual(code, 0)
+        batch.assert_called_once_with(["a.oft", "b.oft", "c.oft"], 2, False)
+        single.assert_not_called()
+        
+        # An existing non-.eml second path is not overwritten as the output
+        other_input = Path(self.temp_dir) / "other.msg"
+        other_input.write_bytes(b"original")
+        code, single, batch, verbose = run_main("in.oft", str(other_input))
+        self.assertEqual(code, 2)
+        single.assert_not_called()
+        self.assertEqual(other_input.read_bytes(), b"original")
+        
+        # --verbose after the paths (documented in AGENT.md) is accepted and forces output on
+        with mock.patch.object(converter, '_VERBOSE', False):
+            code, single, batch, verbose = run_main("in.oft", "out.eml", "--verbose")
+        self.assertEqual(code, 0)
+        self.assertTrue(verbose)
+        code, single, batch, verbose = run_main("-q", "in.oft", "out.eml")
+        self.assertEqual(code, 0)
+        self.assertFalse(verbose)
+        
+        # --jobs must be positive
+        code, single, batch, verbose = run_main("-j", "0", "a.oft", "b.oft", "c.oft")
+        self.assertEqual(code, 2)
+        batch.assert_not_called()
 
 
 class TestConverterModule(unittest.TestCase):
@@ -193,6 +319,89 @@ class TestConverterModule(unittest.TestCase):
         """Test that the main function exists for command line usage."""
         from converter import main
         self.assertTrue(callable(main))
+    
+    def test_base64_payload_encoding(self):
+        """Test that attachment payloads are base64 encoded and wrapped at 76 chars."""
+        import base64
+        from email.mime.base import MIMEBase
+        from converter import _set_base64_payload
+        
+        data = bytes(range(256)) * 40
+        part = MIMEBase('application', 'octet-stream')
+        _set_base64_payload(part, data)
+        
+        self.assertEqual(part['Content-Transfer-Encoding'], 'base64')
+        lines = part.get_payload().splitlines()
+        self.assertTrue(all(len(line) <= 76 for line in lines))
+        self.assertEqual(base64.b64decode(''.join(lines)), data)
+        self.assertEqual(part.get_payload(decode=True), data)
+    
+    def test_body_container(self):
+        """Test that multipart/alternative is only used when both bodies exist."""
+        from converter import _build_body_container
+        
+        self.assertIsNone(_build_body_container(None, None))
+        self.assertEqual(_build_body_container("text", None).get_content_type(), 'text/plain')
+        self.assertEqual(_build_body_container(None, b"<p>html</p>").get_content_type(), 'text/html')
+        
+        container = _build_body_container("text", b"<p>html</p>")
+        self.assertEqual(container.get_content_type(), 'multipart/alternative')
+        self.assertEqual([p.get_content_type() for p in container.iter_parts()],
+                         ['text/plain', 'text/html'])
+    
+    def test_passthrough_message(self):
+        """Test that stored transport headers are reused only for single-part messages."""
+        from converter import _passthrough_message
+        
+        headers = ("Received: from a by b; Mon, 1 Jan 2024 10:00:00 +0000\r\n"
+                   "From: sender@example.com\r\n"
+                   "Subject: Template\r\n"
+                   "Content-Type: text/plain; charset=\"iso-8859-1\"\r\n"
+                   "Content-Transfer-Encoding: quoted-printable\r\n")
+        
+        msg = _passthrough_message(headers, "Grüße", None)
+        self.assertIsNotNone(msg)
+        self.assertIn('Received', msg)
+        self.assertEqual(msg.get_content_charset(), 'utf-8')
+        self.assertEqual(msg['Content-Transfer-Encoding'], '8bit')
+        self.assertEqual(msg.get_content().strip(), "Grüße")
+        
+        # Outlook's banner line is stripped before parsing
+        banner = "Microsoft Mail Internet Headers Version 2.0\r\n"
+        msg = _passthrough_message(banner + headers, "text", None)
+        self.assertIsNotNone(msg)
+        self.assertEqual(msg['Subject'], "Template")
+        self.assertNotIn('Microsoft', msg.as_string())
+        
+        self.assertIsNone(_passthrough_message(None, "text", None))
+        self.assertIsNone(_passthrough_message(headers.replace("From:", "X-From:"), "text", None))
+        self.assertIsNone(_passthrough_message("not a header\r\n" + headers, "text", None))
+        self.assertIsNone(_passthrough_message(headers, None, b"<p>html</p>"))
+        multipart = headers.replace("text/plain", "multipart/alternative")
+        self.assertIsNone(_passthrough_message(multipart, "text", b"<p>html</p>"))
+    
+    def test_image_subtype(self):
+        """Test that inline image extensions map to MIME image subtypes."""
+        from converter import _image_subtype
+        
+        self.assertEqual(_image_subtype("logo.PNG"), 'png')
+        self.assertEqual(_image_subtype("photo.v2.jpg"), 'jpeg')
+        self.assertIsNone(_image_subtype("report.pdf"))
+        self.assertIsNone(_image_subtype("png"))
+    
+    def test_text_part_transfer_encoding(self):
+        """Test that text bodies are stored unencoded unless lines are too long."""
+        from converter import _text_part
+        
+        self.assertEqual(_text_part("plain ascii", 'plain')['Content-Transfer-Encoding'], '7bit')
+        
+        html = "<p>Grüße</p>".encode('utf-8')
+        part = _text_part(html, 'html')
+        self.assertEqual(part['Content-Transfer-Encoding'], '8bit')
+        self.assertEqual(part.get_payload(decode=True), html)
+        
+        part = _text_part("x" * 1000, 'plain')
+        self.assertEqual(part['Content-Transfer-Encoding'], 'base64')
 
 
 def run_tests():